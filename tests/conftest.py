@@ -0,0 +1,84 @@
+"""
+Shared fixtures for the High School Management System API tests
+"""
+
+import pytest
+from asgi_lifespan import LifespanManager
+from httpx import ASGITransport, AsyncClient
+
+from app import app, activities
+from tests.helpers import TEMPLATE
+
+
+# Participants are the only field the API mutates, so they are all a test
+# needs to put back.
+_PRISTINE_PARTICIPANTS = {
+    name: tuple(details["participants"]) for name, details in TEMPLATE.items()
+}
+
+
+def _copy_activities(source):
+    """Copy activities data, giving each activity its own participants list"""
+    return {
+        name: {**details, "participants": list(details["participants"])}
+        for name, details in source.items()
+    }
+
+
+@pytest.fixture(scope="session")
+async def _app_lifespan():
+    """Run the app's lifespan once per session, keeping any state it yields"""
+    async with LifespanManager(app) as manager:
+        yield manager
+
+
+@pytest.fixture(scope="session")
+async def client(_app_lifespan):
+    """Create a single async test client for the FastAPI app, shared by all tests"""
+    transport = ASGITransport(app=_app_lifespan.app)
+    async with AsyncClient(transport=transport, base_url="http://test") as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+async def all_activities_response(client, initialize_activities):
+    """GET /activities response for the pristine data, fetched once per session"""
+    return await client.get("/activities")
+
+
+@pytest.fixture(scope="session")
+def all_activities(all_activities_response):
+    """Parsed GET /activities payload, decoded once per session"""
+    return all_activities_response.json()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def initialize_activities():
+    """Load the pristine activities data once for the whole session"""
+    activities.clear()
+    activities.update(_copy_activities(TEMPLATE))
+
+
+@pytest.fixture(autouse=True)
+def reset_activities(initialize_activities):
+    """Restore the participants of any activity a test has modified"""
+    yield
+    # A test that changed anything beyond participant lists gets the whole
+    # database rebuilt, so the failure stays with that one test
+    drifted = activities.keys() != TEMPLATE.keys() or any(
+        {**details, "participants": None} != {**TEMPLATE[name], "participants": None}
+        for name, details in activities.items()
+    )
+    if drifted:
+        activities.clear()
+        activities.update(_copy_activities(TEMPLATE))
+        pytest.fail("Test modified activities data beyond participant lists")
+    for name, original in _PRISTINE_PARTICIPANTS.items():
+        if tuple(activities[name]["participants"]) != original:
+            activities[name]["participants"] = list(original)
+
+
+@pytest.fixture
+def snapshot():
+    """Copy of the activities data as it stands before the test runs"""
+    return _copy_activities(activities)
@@ -0,0 +1,22 @@
+"""
+Shared data for the High School Management System API tests
+"""
+
+import json
+from pathlib import Path
+from urllib.parse import quote
+
+
+# Pristine activity data, loaded once at import time
+TEMPLATE = json.loads(
+    (Path(__file__).parent / "fixtures" / "activities.json").read_text(encoding="utf-8")
+)
+
+# Activity name that is never present in the database
+NONEXISTENT_ACTIVITY = "Nonexistent Club"
+
+# Pre-built, percent-encoded endpoint paths for every known activity, plus
+# the nonexistent one used by the error-path tests
+_ACTIVITY_NAMES = [*TEMPLATE, NONEXISTENT_ACTIVITY]
+SIGNUP_URL = {name: f"/activities/{quote(name)}/signup" for name in _ACTIVITY_NAMES}
+UNREGISTER_URL = {name: f"/activities/{quote(name)}/unregister" for name in _ACTIVITY_NAMES}
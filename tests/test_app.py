@@ -1,102 +1,14 @@
 """
-Tests for the High School Management System API
+Tests for the root and GET /activities endpoints
 """
 
-import pytest
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
-
-# Add src directory to path for importing
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from app import app, activities
-
-
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
-
-
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities data before each test"""
-    # Store original state
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Competitive basketball training and inter-school matches",
-            "schedule": "Tuesdays and Thursdays, 4:00 PM - 6:00 PM",
-            "max_participants": 15,
-            "participants": ["james@mergington.edu", "lucas@mergington.edu"]
-        },
-        "Swimming Club": {
-            "description": "Swimming lessons and competitive swimming events",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 20,
-            "participants": ["ava@mergington.edu", "mia@mergington.edu"]
-        },
-        "Art Studio": {
-            "description": "Explore painting, drawing, and mixed media techniques",
-            "schedule": "Mondays, 3:30 PM - 5:00 PM",
-            "max_participants": 15,
-            "participants": ["isabella@mergington.edu", "charlotte@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Theater performances, acting workshops, and stage productions",
-            "schedule": "Thursdays, 4:00 PM - 6:00 PM",
-            "max_participants": 25,
-            "participants": ["ethan@mergington.edu", "amelia@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Develop critical thinking and public speaking through competitive debates",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 16,
-            "participants": ["william@mergington.edu", "harper@mergington.edu"]
-        },
-        "Science Club": {
-            "description": "Conduct experiments and explore STEM topics through hands-on projects",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["benjamin@mergington.edu", "evelyn@mergington.edu"]
-        }
-    }
-    
-    # Reset to original state
-    activities.clear()
-    activities.update(original_activities)
-    
-    yield
-    
-    # Cleanup after test
-    activities.clear()
-    activities.update(original_activities)
-
 
 class TestRootEndpoint:
     """Tests for the root endpoint"""
     
-    def test_root_redirects_to_static(self, client):
+    async def test_root_redirects_to_static(self, client):
         """Test that root redirects to static/index.html"""
-        response = client.get("/", follow_redirects=False)
+        response = await client.get("/", follow_redirects=False)
         assert response.status_code == 307
         assert response.headers["location"] == "/static/index.html"
 
@@ -104,232 +16,30 @@ class TestRootEndpoint:
 class TestGetActivities:
     """Tests for GET /activities endpoint"""
     
-    def test_get_activities_returns_all_activities(self, client):
+    async def test_get_activities_returns_all_activities(
+        self, all_activities_response, all_activities
+    ):
         """Test getting all activities"""
-        response = client.get("/activities")
-        assert response.status_code == 200
-        data = response.json()
+        assert all_activities_response.status_code == 200
         
         # Verify expected activities are present
-        assert "Chess Club" in data
-        assert "Programming Class" in data
-        assert "Basketball Team" in data
-        assert len(data) == 9
+        assert "Chess Club" in all_activities
+        assert "Programming Class" in all_activities
+        assert "Basketball Team" in all_activities
+        assert len(all_activities) == 9
     
-    def test_get_activities_returns_correct_structure(self, client):
+    async def test_get_activities_returns_correct_structure(self, all_activities):
         """Test that activities have the correct structure"""
-        response = client.get("/activities")
-        data = response.json()
-        
         # Check Chess Club structure
-        chess_club = data["Chess Club"]
+        chess_club = all_activities["Chess Club"]
         assert "description" in chess_club
         assert "schedule" in chess_club
         assert "max_participants" in chess_club
         assert "participants" in chess_club
         assert isinstance(chess_club["participants"], list)
     
-    def test_get_activities_returns_participants(self, client):
+    async def test_get_activities_returns_participants(self, all_activities):
         """Test that activities include participants list"""
-        response = client.get("/activities")
-        data = response.json()
-        
-        chess_club = data["Chess Club"]
+        chess_club = all_activities["Chess Club"]
         assert "michael@mergington.edu" in chess_club["participants"]
         assert "daniel@mergington.edu" in chess_club["participants"]
-
-
-class TestSignupForActivity:
-    """Tests for POST /activities/{activity_name}/signup endpoint"""
-    
-    def test_signup_for_activity_success(self, client):
-        """Test successful signup for an activity"""
-        response = client.post(
-            "/activities/Chess Club/signup?email=newstudent@mergington.edu"
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["message"] == "Signed up newstudent@mergington.edu for Chess Club"
-        
-        # Verify student was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "newstudent@mergington.edu" in activities_data["Chess Club"]["participants"]
-    
-    def test_signup_for_nonexistent_activity(self, client):
-        """Test signup for an activity that doesn't exist"""
-        response = client.post(
-            "/activities/Nonexistent Club/signup?email=student@mergington.edu"
-        )
-        assert response.status_code == 404
-        assert response.json()["detail"] == "Activity not found"
-    
-    def test_signup_for_activity_already_signed_up(self, client):
-        """Test signing up when already enrolled"""
-        # First signup
-        client.post("/activities/Chess Club/signup?email=test@mergington.edu")
-        
-        # Try to signup again
-        response = client.post(
-            "/activities/Chess Club/signup?email=test@mergington.edu"
-        )
-        assert response.status_code == 400
-        assert response.json()["detail"] == "Student already signed up"
-    
-    def test_signup_multiple_students_to_same_activity(self, client):
-        """Test multiple students can sign up for the same activity"""
-        response1 = client.post(
-            "/activities/Programming Class/signup?email=alice@mergington.edu"
-        )
-        response2 = client.post(
-            "/activities/Programming Class/signup?email=bob@mergington.edu"
-        )
-        
-        assert response1.status_code == 200
-        assert response2.status_code == 200
-        
-        # Verify both students were added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        participants = activities_data["Programming Class"]["participants"]
-        assert "alice@mergington.edu" in participants
-        assert "bob@mergington.edu" in participants
-    
-    def test_signup_preserves_existing_participants(self, client):
-        """Test that signing up doesn't remove existing participants"""
-        # Get original participants
-        original_response = client.get("/activities")
-        original_participants = original_response.json()["Chess Club"]["participants"]
-        original_count = len(original_participants)
-        
-        # Add new student
-        client.post("/activities/Chess Club/signup?email=newstudent@mergington.edu")
-        
-        # Verify original participants are still there
-        new_response = client.get("/activities")
-        new_participants = new_response.json()["Chess Club"]["participants"]
-        assert len(new_participants) == original_count + 1
-        for participant in original_participants:
-            assert participant in new_participants
-
-
-class TestUnregisterFromActivity:
-    """Tests for DELETE /activities/{activity_name}/unregister endpoint"""
-    
-    def test_unregister_from_activity_success(self, client):
-        """Test successful unregistration from an activity"""
-        email = "michael@mergington.edu"
-        response = client.delete(
-            f"/activities/Chess Club/unregister?email={email}"
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["message"] == f"Unregistered {email} from Chess Club"
-        
-        # Verify student was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email not in activities_data["Chess Club"]["participants"]
-    
-    def test_unregister_from_nonexistent_activity(self, client):
-        """Test unregister from an activity that doesn't exist"""
-        response = client.delete(
-            "/activities/Nonexistent Club/unregister?email=student@mergington.edu"
-        )
-        assert response.status_code == 404
-        assert response.json()["detail"] == "Activity not found"
-    
-    def test_unregister_student_not_signed_up(self, client):
-        """Test unregistering a student who isn't signed up"""
-        response = client.delete(
-            "/activities/Chess Club/unregister?email=notsignedup@mergington.edu"
-        )
-        assert response.status_code == 400
-        assert response.json()["detail"] == "Student not signed up for this activity"
-    
-    def test_unregister_preserves_other_participants(self, client):
-        """Test that unregistering doesn't affect other participants"""
-        # Get original participants
-        original_response = client.get("/activities")
-        original_participants = original_response.json()["Chess Club"]["participants"]
-        
-        # Remove one student
-        email_to_remove = original_participants[0]
-        client.delete(f"/activities/Chess Club/unregister?email={email_to_remove}")
-        
-        # Verify other participants are still there
-        new_response = client.get("/activities")
-        new_participants = new_response.json()["Chess Club"]["participants"]
-        assert len(new_participants) == len(original_participants) - 1
-        for participant in original_participants:
-            if participant != email_to_remove:
-                assert participant in new_participants
-    
-    def test_signup_after_unregister(self, client):
-        """Test that a student can signup again after unregistering"""
-        email = "michael@mergington.edu"
-        
-        # Unregister
-        unregister_response = client.delete(
-            f"/activities/Chess Club/unregister?email={email}"
-        )
-        assert unregister_response.status_code == 200
-        
-        # Sign up again
-        signup_response = client.post(
-            f"/activities/Chess Club/signup?email={email}"
-        )
-        assert signup_response.status_code == 200
-        
-        # Verify student is in the list
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data["Chess Club"]["participants"]
-
-
-class TestActivityIntegration:
-    """Integration tests for multiple activity operations"""
-    
-    def test_full_activity_lifecycle(self, client):
-        """Test complete lifecycle: signup, verify, unregister, verify"""
-        email = "lifecycle@mergington.edu"
-        activity = "Swimming Club"
-        
-        # Initial state - student not signed up
-        initial_response = client.get("/activities")
-        initial_data = initial_response.json()
-        assert email not in initial_data[activity]["participants"]
-        
-        # Signup
-        signup_response = client.post(f"/activities/{activity}/signup?email={email}")
-        assert signup_response.status_code == 200
-        
-        # Verify signup
-        after_signup_response = client.get("/activities")
-        after_signup_data = after_signup_response.json()
-        assert email in after_signup_data[activity]["participants"]
-        
-        # Unregister
-        unregister_response = client.delete(f"/activities/{activity}/unregister?email={email}")
-        assert unregister_response.status_code == 200
-        
-        # Verify unregistration
-        final_response = client.get("/activities")
-        final_data = final_response.json()
-        assert email not in final_data[activity]["participants"]
-    
-    def test_multiple_activities_per_student(self, client):
-        """Test that a student can sign up for multiple activities"""
-        email = "multitasker@mergington.edu"
-        activities_to_join = ["Chess Club", "Programming Class", "Art Studio"]
-        
-        # Sign up for multiple activities
-        for activity in activities_to_join:
-            response = client.post(f"/activities/{activity}/signup?email={email}")
-            assert response.status_code == 200
-        
-        # Verify student is in all activities
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        for activity in activities_to_join:
-            assert email in activities_data[activity]["participants"]
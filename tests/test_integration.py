@@ -0,0 +1,53 @@
+"""
+Integration tests for multiple activity operations
+"""
+
+import asyncio
+
+from app import activities
+from tests.helpers import SIGNUP_URL, UNREGISTER_URL
+
+
+class TestActivityIntegration:
+    """Integration tests for multiple activity operations"""
+    
+    async def test_full_activity_lifecycle(self, client):
+        """Test complete lifecycle: signup, verify, unregister, verify"""
+        email = "lifecycle@mergington.edu"
+        activity = "Swimming Club"
+        
+        # Initial state - student not signed up
+        assert email not in activities[activity]["participants"]
+        
+        # Signup
+        signup_response = await client.post(SIGNUP_URL[activity], params={"email": email})
+        assert signup_response.status_code == 200
+        
+        # Verify signup
+        assert email in activities[activity]["participants"]
+        
+        # Unregister
+        unregister_response = await client.delete(UNREGISTER_URL[activity], params={"email": email})
+        assert unregister_response.status_code == 200
+        
+        # Verify unregistration
+        assert email not in activities[activity]["participants"]
+    
+    async def test_multiple_activities_per_student(self, client):
+        """Test that a student can sign up for multiple activities"""
+        email = "multitasker@mergington.edu"
+        activities_to_join = ["Chess Club", "Programming Class", "Art Studio"]
+        
+        # Sign up for multiple activities concurrently
+        responses = await asyncio.gather(*[
+            client.post(SIGNUP_URL[activity], params={"email": email})
+            for activity in activities_to_join
+        ])
+        assert [response.status_code for response in responses] == [200] * len(activities_to_join)
+        
+        # Verify student is in all activities
+        missing = [
+            activity for activity in activities_to_join
+            if email not in activities[activity]["participants"]
+        ]
+        assert missing == []
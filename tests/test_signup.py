@@ -0,0 +1,74 @@
+"""
+Tests for signing up for activities
+"""
+
+from app import activities
+from tests.helpers import NONEXISTENT_ACTIVITY, SIGNUP_URL
+
+
+class TestSignupForActivity:
+    """Tests for POST /activities/{activity_name}/signup endpoint"""
+    
+    async def test_signup_for_activity_success(self, client):
+        """Test successful signup for an activity"""
+        response = await client.post(
+            SIGNUP_URL["Chess Club"], params={"email": "newstudent@mergington.edu"}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["message"] == "Signed up newstudent@mergington.edu for Chess Club"
+        
+        # Verify student was added
+        assert "newstudent@mergington.edu" in activities["Chess Club"]["participants"]
+    
+    async def test_signup_for_nonexistent_activity(self, client):
+        """Test signup for an activity that doesn't exist"""
+        response = await client.post(
+            SIGNUP_URL[NONEXISTENT_ACTIVITY],
+            params={"email": "student@mergington.edu"},
+        )
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Activity not found"
+    
+    async def test_signup_for_activity_already_signed_up(self, client):
+        """Test signing up when already enrolled"""
+        # First signup
+        await client.post(SIGNUP_URL["Chess Club"], params={"email": "test@mergington.edu"})
+        
+        # Try to signup again
+        response = await client.post(
+            SIGNUP_URL["Chess Club"], params={"email": "test@mergington.edu"}
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Student already signed up"
+    
+    async def test_signup_multiple_students_to_same_activity(self, client):
+        """Test multiple students can sign up for the same activity"""
+        response1 = await client.post(
+            SIGNUP_URL["Programming Class"], params={"email": "alice@mergington.edu"}
+        )
+        response2 = await client.post(
+            SIGNUP_URL["Programming Class"], params={"email": "bob@mergington.edu"}
+        )
+        
+        assert response1.status_code == 200
+        assert response2.status_code == 200
+        
+        # Verify both students were added
+        participants = activities["Programming Class"]["participants"]
+        assert "alice@mergington.edu" in participants
+        assert "bob@mergington.edu" in participants
+    
+    async def test_signup_preserves_existing_participants(self, client, snapshot):
+        """Test that signing up doesn't remove existing participants"""
+        # Get original participants
+        original_participants = snapshot["Chess Club"]["participants"]
+        original_count = len(original_participants)
+        
+        # Add new student
+        await client.post(SIGNUP_URL["Chess Club"], params={"email": "newstudent@mergington.edu"})
+        
+        # Verify original participants are still there
+        new_participants = activities["Chess Club"]["participants"]
+        assert len(new_participants) == original_count + 1
+        assert set(original_participants) <= set(new_participants)
@@ -0,0 +1,70 @@
+"""
+Tests for unregistering from activities
+"""
+
+import pytest
+
+from app import activities
+from tests.helpers import NONEXISTENT_ACTIVITY, SIGNUP_URL, UNREGISTER_URL
+
+
+class TestUnregisterFromActivity:
+    """Tests for DELETE /activities/{activity_name}/unregister endpoint"""
+    
+    async def test_unregister_from_activity_success(self, client):
+        """Test successful unregistration from an activity"""
+        email = "michael@mergington.edu"
+        response = await client.delete(
+            UNREGISTER_URL["Chess Club"], params={"email": email}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["message"] == f"Unregistered {email} from Chess Club"
+        
+        # Verify student was removed
+        assert email not in activities["Chess Club"]["participants"]
+    
+    @pytest.mark.parametrize("url,email,status_code,detail", [
+        (UNREGISTER_URL[NONEXISTENT_ACTIVITY], "student@mergington.edu",
+         404, "Activity not found"),
+        (UNREGISTER_URL["Chess Club"], "notsignedup@mergington.edu",
+         400, "Student not signed up for this activity"),
+    ], ids=["nonexistent-activity", "not-signed-up"])
+    async def test_unregister_error(self, client, url, email, status_code, detail):
+        """Test that invalid unregister requests return the expected error"""
+        response = await client.delete(url, params={"email": email})
+        assert response.status_code == status_code
+        assert response.json()["detail"] == detail
+    
+    async def test_unregister_preserves_other_participants(self, client, snapshot):
+        """Test that unregistering doesn't affect other participants"""
+        # Get original participants
+        original_participants = snapshot["Chess Club"]["participants"]
+        
+        # Remove one student
+        email_to_remove = original_participants[0]
+        await client.delete(UNREGISTER_URL["Chess Club"], params={"email": email_to_remove})
+        
+        # Verify other participants are still there
+        new_participants = activities["Chess Club"]["participants"]
+        assert len(new_participants) == len(original_participants) - 1
+        assert set(original_participants) - {email_to_remove} <= set(new_participants)
+    
+    async def test_signup_after_unregister(self, client):
+        """Test that a student can signup again after unregistering"""
+        email = "michael@mergington.edu"
+        
+        # Unregister
+        unregister_response = await client.delete(
+            UNREGISTER_URL["Chess Club"], params={"email": email}
+        )
+        assert unregister_response.status_code == 200
+        
+        # Sign up again
+        signup_response = await client.post(
+            SIGNUP_URL["Chess Club"], params={"email": email}
+        )
+        assert signup_response.status_code == 200
+        
+        # Verify student is in the list
+        assert email in activities["Chess Club"]["participants"]